@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+@dataclass(slots=True)
+class Pinner:
+    id: Any = None
+    username: Optional[str] = None
+    fullName: Optional[str] = None
+    avatarURL: Optional[str] = None
+    followers: Optional[int] = None
+
+@dataclass(slots=True)
+class NormalizedPin:
+    """
+    A scraped pin in the exported schema.
+
+    Field names match the exported keys, so serializers that understand
+    dataclasses (orjson) produce the same output as ``to_dict()``.
+    """
+
+    id: str
+    title: str
+    pinner: Pinner
+    date: Dict[str, Any]
+    type: str = "pin"
+    imageURL: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        pinner = self.pinner
+        return {
+            "id": self.id,
+            "title": self.title,
+            "pinner": {
+                "id": pinner.id,
+                "username": pinner.username,
+                "fullName": pinner.fullName,
+                "avatarURL": pinner.avatarURL,
+                "followers": pinner.followers,
+            },
+            "date": self.date,
+            "type": self.type,
+            "imageURL": self.imageURL,
+        }
@@ -1,18 +1,242 @@
+import asyncio
 import json
 import logging
+import multiprocessing
 import random
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 
+from .models import NormalizedPin, Pinner
+from .response_cache import CachedResponse, ResponseCache
 from .utils_time import parse_pinterest_timestamp
 
 logger = logging.getLogger("pinterest_parser")
 
+# Prefer the C-backed lxml tree builder; fall back to the pure-Python
+# parser bundled with BeautifulSoup when lxml is not installed.
+try:
+    import lxml  # noqa: F401
+
+    _BS4_PARSER = "lxml"
+except ImportError:
+    _BS4_PARSER = "html.parser"
+
+# Only advertise brotli when urllib3 can actually decode it.
+try:
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# Inline <script> bodies and the markers Pinterest uses for its embedded
+# state. Both operate on raw response bytes so the happy path never has
+# to decode the page or build a DOM.
+_SCRIPT_RE = re.compile(rb"<script[^>]*>(.*?)</script>", re.DOTALL | re.IGNORECASE)
+_MARKER_RE = re.compile(rb"__PWS_DATA__|initialReduxState")
+
+# When available, Hyperscan's DFA scans for the markers far faster than
+# the backtracking re engine on multi-MB pages.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+_MARKER_DB = None
+if hyperscan is not None:
+    try:
+        _MARKER_DB = hyperscan.Database()
+        _MARKER_DB.compile(
+            expressions=[b"__PWS_DATA__", b"initialReduxState"],
+            ids=[0, 1],
+            elements=2,
+            flags=[0, 0],
+        )
+    except hyperscan.error as exc:
+        # e.g. a CPU without the instruction set Hyperscan requires
+        logger.debug("Hyperscan unavailable, using re for markers: %s", exc)
+        _MARKER_DB = None
+
+def _stop_on_first_match(*_: Any) -> bool:
+    return True
+
+def _has_marker(data: bytes) -> bool:
+    if _MARKER_DB is None:
+        return _MARKER_RE.search(data) is not None
+    try:
+        _MARKER_DB.scan(data, match_event_handler=_stop_on_first_match)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+# Numeric path segment used to synthesize pin IDs from image URLs.
+_PIN_ID_FROM_URL_RE = re.compile(r"/(\d+)/")
+
+# Below this many requested pins, process start-up and pickling the raw
+# pins costs more than normalizing them in-process.
+_PARALLEL_NORMALIZE_MIN_PINS = 200
+_NORMALIZE_CHUNK_SIZE = 64
+
+def _looks_like_pin(node: Dict[str, Any]) -> bool:
+    """
+    Heuristics:
+    - Has an 'id' field.
+    - Contains 'images' or 'grid_title' or 'title'.
+    """
+    return "id" in node and (
+        "images" in node or "grid_title" in node or "title" in node
+    )
+
+class _PinLimitReached(Exception):
+    """Raised from inside the JSON decoder to stop once enough pins are found."""
+
+class _PinCollector:
+    """
+    json object_hook that records pin-like dicts while the decoder builds them.
+
+    The decoder calls the hook bottom-up, so nested pin-like objects are
+    recorded before the object that contains them. With ``normalize`` set,
+    each candidate is converted as soon as it is decoded and only the ones
+    it accepts (non-None) are kept and counted toward ``limit``.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        normalize: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> None:
+        self.limit = limit
+        self.normalize = normalize
+        self.pins: List[Any] = []
+
+    def __call__(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        if _looks_like_pin(node):
+            pin = node if self.normalize is None else self.normalize(node)
+            if pin is not None:
+                self.pins.append(pin)
+                if self.limit is not None and len(self.pins) >= self.limit:
+                    raise _PinLimitReached
+        return node
+
+def _loads_json(
+    text: Union[str, bytes], object_hook: Optional[Callable[[Dict[str, Any]], Any]]
+) -> Optional[Any]:
+    """
+    Decode ``text``, returning None when it is not valid JSON.
+
+    A collector hook has already recorded pins from the part of the blob
+    decoded before the error, so those are dropped again on failure.
+    """
+    collector = object_hook if isinstance(object_hook, _PinCollector) else None
+    mark = len(collector.pins) if collector is not None else 0
+    try:
+        return json.loads(text, object_hook=object_hook)
+    except (ValueError, RecursionError):
+        if collector is not None:
+            del collector.pins[mark:]
+        return None
+
+# Alternative spellings Pinterest uses for the same field, in priority order.
+_PINNER_ID_KEYS = ("id", "user_id")
+_USERNAME_KEYS = ("username", "urlname")
+_FULL_NAME_KEYS = ("full_name", "fullName")
+_FOLLOWERS_KEYS = ("follower_count", "followers")
+_AVATAR_KEYS = ("image_small_url", "image_medium_url", "image_xlarge_url")
+
+def _first(data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """
+    Return the first non-None value among ``keys``. Unlike chaining ``or``,
+    legitimate falsy values such as 0 followers are kept.
+    """
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return None
+
+def _extract_primary_image_url(pin_obj: Dict[str, Any]) -> Optional[str]:
+    images = pin_obj.get("images")
+    if not isinstance(images, dict):
+        return None
+
+    # Prioritise 'orig', then other sizes
+    if "orig" in images and isinstance(images["orig"], dict):
+        return images["orig"].get("url")
+
+    for size_data in images.values():
+        if isinstance(size_data, dict) and "url" in size_data:
+            return size_data["url"]
+
+    return None
+
+def _normalize_pin(pin_obj: Dict[str, Any]) -> NormalizedPin:
+    """
+    Map a raw Pinterest pin object onto the exported pin schema.
+
+    Kept at module level so it can be pickled into worker processes.
+    """
+    pin_id = str(pin_obj.get("id"))
+    title = (
+        pin_obj.get("grid_title")
+        or pin_obj.get("title")
+        or pin_obj.get("description")
+        or ""
+    )
+
+    pinner = pin_obj.get("pinner") or pin_obj.get("owner") or {}
+    if not isinstance(pinner, dict):
+        pinner = {}
+
+    pinner_id = _first(pinner, _PINNER_ID_KEYS)
+    username = _first(pinner, _USERNAME_KEYS)
+    full_name = _first(pinner, _FULL_NAME_KEYS)
+    avatar_url = next((pinner[k] for k in _AVATAR_KEYS if k in pinner), None)
+    followers = _first(pinner, _FOLLOWERS_KEYS)
+
+    created_at = (
+        pin_obj.get("created_at")
+        or pin_obj.get("created_at_timestamp")
+        or pin_obj.get("createdAt")
+    )
+    date_info = parse_pinterest_timestamp(created_at)
+
+    image_url = _extract_primary_image_url(pin_obj) or ""
+
+    return NormalizedPin(
+        id=pin_id,
+        title=title,
+        pinner=Pinner(
+            id=pinner_id,
+            username=username,
+            fullName=full_name,
+            avatarURL=avatar_url,
+            followers=followers,
+        ),
+        date=date_info,
+        type=pin_obj.get("type") or "pin",
+        imageURL=image_url,
+    )
+
+def _try_normalize_pin(pin_obj: Dict[str, Any]) -> Optional[NormalizedPin]:
+    try:
+        return _normalize_pin(pin_obj)
+    except Exception as exc:
+        logger.debug("Failed to normalize pin object: %s", exc)
+        return None
+
+def _normalize_pins(pin_objs: List[Dict[str, Any]]) -> List[NormalizedPin]:
+    normalized = (_try_normalize_pin(pin_obj) for pin_obj in pin_objs)
+    return [pin for pin in normalized if pin is not None]
+
 @dataclass
 class PinterestScraperConfig:
     base_url: str = "https://www.pinterest.com/search/pins/"
@@ -20,6 +244,7 @@ class PinterestScraperConfig:
     max_retries: int = 3
     backoff_factor: float = 0.5
     user_agent: str = "PinterestSearchScraper/1.0"
+    normalize_workers: int = 0
 
 class PinterestSearchScraper:
     """
@@ -38,6 +263,8 @@ class PinterestSearchScraper:
         max_retries: int = 3,
         backoff_factor: float = 0.5,
         user_agent: str = "PinterestSearchScraper/1.0",
+        normalize_workers: int = 0,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self.config = PinterestScraperConfig(
             base_url=base_url,
@@ -45,15 +272,23 @@ class PinterestSearchScraper:
             max_retries=max_retries,
             backoff_factor=backoff_factor,
             user_agent=user_agent,
+            normalize_workers=normalize_workers,
         )
+        self.headers = {
+            "User-Agent": self.config.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+        }
         self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": self.config.user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-            }
-        )
+        self.session.headers.update(self.headers)
+        # Keep connections alive across searches; retries are handled by
+        # _request_with_retries, so the adapter itself never retries.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.response_cache = response_cache
+        self._executor: Optional[ProcessPoolExecutor] = None
 
     def _build_search_url(
         self, query: str, content_filter: str = "all"
@@ -68,6 +303,52 @@ class PinterestSearchScraper:
         # because we'll pass them separately to session.get.
         return self.config.base_url, params
 
+    def _request(
+        self, url: str, params: Dict[str, Any]
+    ) -> Union[requests.Response, CachedResponse, None]:
+        cached = self._cached_response(url, params)
+        if cached is not None:
+            return cached
+        return self._request_with_retries(url, params)
+
+    async def _request_async(
+        self, client: httpx.AsyncClient, url: str, params: Dict[str, Any]
+    ) -> Union[httpx.Response, CachedResponse, None]:
+        cached = self._cached_response(url, params)
+        if cached is not None:
+            return cached
+        return await self._request_with_retries_async(client, url, params)
+
+    def _cached_response(
+        self, url: str, params: Dict[str, Any]
+    ) -> Optional[CachedResponse]:
+        if self.response_cache is None:
+            return None
+        content = self.response_cache.get(url, params)
+        if content is None:
+            return None
+        logger.debug("Serving %s %s from the response cache", url, params)
+        return CachedResponse(content)
+
+    def _store_response(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        resp: Union[requests.Response, httpx.Response, CachedResponse, None],
+        pins: List[NormalizedPin],
+    ) -> None:
+        """
+        Cache a fetched body only once pins were parsed from it, so a
+        bot-wall or captcha page served with status 200 is never reused.
+        Bodies that came from the cache are not rewritten, which would
+        otherwise keep extending their TTL.
+        """
+        if self.response_cache is None or resp is None or not pins:
+            return
+        if isinstance(resp, CachedResponse):
+            return
+        self.response_cache.put(url, params, resp.content)
+
     def _request_with_retries(
         self, url: str, params: Dict[str, Any]
     ) -> Optional[requests.Response]:
@@ -84,9 +365,7 @@ class PinterestSearchScraper:
                     )
                 return resp
             except Exception as exc:
-                wait = self.config.backoff_factor * (2 ** (attempt - 1))
-                jitter = random.uniform(0, wait / 2)
-                sleep_for = wait + jitter
+                sleep_for = self._backoff_delay(attempt)
                 logger.warning(
                     "Request attempt %d failed (%s). Retrying in %.2fs...",
                     attempt,
@@ -97,200 +376,290 @@ class PinterestSearchScraper:
         logger.error("All retry attempts failed for URL %s", url)
         return None
 
+    async def _request_with_retries_async(
+        self, client: httpx.AsyncClient, url: str, params: Dict[str, Any]
+    ) -> Optional[httpx.Response]:
+        for attempt in range(1, self.config.max_retries + 1):
+            try:
+                resp = await client.get(url, params=params)
+                if resp.status_code >= 500:
+                    raise httpx.HTTPError(f"Server error {resp.status_code}")
+                return resp
+            except Exception as exc:
+                sleep_for = self._backoff_delay(attempt)
+                logger.warning(
+                    "Request attempt %d failed (%s). Retrying in %.2fs...",
+                    attempt,
+                    exc,
+                    sleep_for,
+                )
+                await asyncio.sleep(sleep_for)
+        logger.error("All retry attempts failed for URL %s", url)
+        return None
+
+    def _backoff_delay(self, attempt: int) -> float:
+        wait = self.config.backoff_factor * (2 ** (attempt - 1))
+        jitter = random.uniform(0, wait / 2)
+        return wait + jitter
+
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Build an HTTP/2 client with the same headers, timeout and redirect
+        handling as the sync session. Share one client across concurrent ``search_async``
+        calls so they multiplex over a single connection.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            timeout=self.config.timeout,
+            follow_redirects=True,
+        )
+
     def _extract_json_blobs_from_html(
-        self, html: str
+        self,
+        html: bytes,
+        object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search the HTML for JSON blobs that might contain pin data.
         Pinterest often embeds a large JSON object in a script tag.
+
+        Script bodies are located with a regex over the raw bytes; the
+        BeautifulSoup path is only used when the markers are present but
+        the regex could not recover any blob from them. ``object_hook`` is
+        handed to the JSON decoder for every blob.
         """
-        soup = BeautifulSoup(html, "html.parser")
         blobs: List[Dict[str, Any]] = []
 
-        # Look for inline scripts that contain JSON-like structures
-        for script in soup.find_all("script"):
-            text = script.string or script.text
+        for match in _SCRIPT_RE.finditer(html):
+            text = match.group(1)
             if not text:
                 continue
 
             # Common patterns seen in Pinterest pages
-            if "__PWS_DATA__" in text or "initialReduxState" in text:
-                try:
-                    first_brace = text.index("{")
-                    last_brace = text.rindex("}")
-                    json_str = text[first_brace : last_brace + 1]
-                    data = json.loads(json_str)
-                    blobs.append(data)
-                except Exception:
-                    continue
+            if _has_marker(text):
+                first_brace = text.find(b"{")
+                last_brace = text.rfind(b"}")
+                if first_brace != -1 and last_brace > first_brace:
+                    data = _loads_json(
+                        text[first_brace : last_brace + 1], object_hook
+                    )
+                    if data is not None:
+                        blobs.append(data)
+                        continue
 
             # Also try scripts that look like pure JSON
-            if text.strip().startswith("{") and text.strip().endswith("}"):
-                try:
-                    blobs.append(json.loads(text))
-                except Exception:
-                    continue
+            text = text.strip()
+            if text.startswith(b"{") and text.endswith(b"}"):
+                data = _loads_json(text, object_hook)
+                if data is not None:
+                    blobs.append(data)
+
+        if not blobs and _has_marker(html):
+            logger.debug(
+                "Regex script scan found no blobs; retrying with BeautifulSoup"
+            )
+            blobs = self._extract_json_blobs_with_soup(html, object_hook)
 
         logger.debug("Extracted %d JSON blobs from HTML", len(blobs))
         return blobs
 
-    def _iter_dicts(self, obj: Any) -> Iterable[Dict[str, Any]]:
-        if isinstance(obj, dict):
-            yield obj
-            for v in obj.values():
-                yield from self._iter_dicts(v)
-        elif isinstance(obj, list):
-            for v in obj:
-                yield from self._iter_dicts(v)
+    def _extract_json_blobs_with_soup(
+        self,
+        html: bytes,
+        object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        soup = BeautifulSoup(html, _BS4_PARSER)
+        blobs: List[Dict[str, Any]] = []
 
-    def _find_pin_objects(self, blobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """
-        Recursively scan blobs for dicts that look like pin objects.
+        # Look for inline scripts that contain JSON-like structures
+        for script in soup.find_all("script"):
+            text = script.string or script.text
+            if not text:
+                continue
+
+            if "__PWS_DATA__" in text or "initialReduxState" in text:
+                first_brace = text.find("{")
+                last_brace = text.rfind("}")
+                if first_brace != -1 and last_brace > first_brace:
+                    data = _loads_json(
+                        text[first_brace : last_brace + 1], object_hook
+                    )
+                    if data is not None:
+                        blobs.append(data)
+                        continue
+
+            text = text.strip()
+            if text.startswith("{") and text.endswith("}"):
+                data = _loads_json(text, object_hook)
+                if data is not None:
+                    blobs.append(data)
+
+        return blobs
 
-        Heuristics:
-        - Has an 'id' field.
-        - Contains 'images' or 'grid_title' or 'title'.
+    def _find_pin_objects(
+        self,
+        html: bytes,
+        limit: Optional[int] = None,
+        normalize: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> List[Any]:
         """
-        pins: List[Dict[str, Any]] = []
-        for blob in blobs:
-            for node in self._iter_dicts(blob):
-                if "id" in node and (
-                    "images" in node or "grid_title" in node or "title" in node
-                ):
-                    pins.append(node)
-        logger.debug("Heuristic parser found %d candidate pins", len(pins))
-        return pins
+        Collect dicts that look like pin objects from the page's JSON blobs.
 
-    def _fallback_parse_from_html(self, html: str) -> List[Dict[str, Any]]:
+        The scan runs inside the JSON decoder through an object_hook, so
+        there is no second walk over the decoded tree. When ``normalize``
+        is given, pins are normalized during the same pass. Decoding stops
+        as soon as ``limit`` pins have been collected.
+        """
+        collector = _PinCollector(limit, normalize)
+        try:
+            self._extract_json_blobs_from_html(html, object_hook=collector)
+        except _PinLimitReached:
+            logger.debug("Pin limit reached; skipping the rest of the page")
+        logger.debug("Heuristic parser found %d pins", len(collector.pins))
+        return collector.pins
+
+    def _fallback_parse_from_html(self, html: bytes) -> List[NormalizedPin]:
         """
         Fallback parser that attempts to extract minimal pin info from HTML only.
         """
-        soup = BeautifulSoup(html, "html.parser")
-        results: List[Dict[str, Any]] = []
-
-        for pin_div in soup.find_all("div"):
-            # This is intentionally broad; we rely on data attributes
-            # that often show up in Pinterest pin elements.
-            data_test_id = pin_div.get("data-test-id", "")
-            if "pin" not in data_test_id.lower():
-                continue
-
-            img = pin_div.find("img")
-            if not img:
+        tree = HTMLParser(html)
+        results: List[NormalizedPin] = []
+
+        # This is intentionally broad; we rely on data attributes
+        # that often show up in Pinterest pin elements.
+        for pin_div in tree.css('div[data-test-id*="pin" i]'):
+            img = pin_div.css_first("img")
+            if img is None:
                 continue
 
-            image_url = img.get("src") or img.get("data-src") or ""
-            alt = img.get("alt") or ""
+            attrs = img.attributes
+            image_url = attrs.get("src") or attrs.get("data-src") or ""
+            alt = attrs.get("alt") or ""
 
-            pin_id = pin_div.get("data-pin-id") or ""
+            pin_id = pin_div.attributes.get("data-pin-id") or ""
             if not pin_id:
                 # Try to synthesize a pseudo-ID from the image URL
-                m = re.search(r"/(\d+)/", image_url)
+                m = _PIN_ID_FROM_URL_RE.search(image_url)
                 pin_id = m.group(1) if m else image_url[-32:]
 
-            pin: Dict[str, Any] = {
-                "id": str(pin_id),
-                "title": alt,
-                "pinner": {
-                    "id": None,
-                    "username": None,
-                    "fullName": None,
-                    "avatarURL": None,
-                    "followers": None,
-                },
-                "date": parse_pinterest_timestamp(None),
-                "type": "pin",
-                "imageURL": image_url,
-            }
-            results.append(pin)
+            results.append(
+                NormalizedPin(
+                    id=str(pin_id),
+                    title=alt,
+                    pinner=Pinner(),
+                    date=parse_pinterest_timestamp(None),
+                    type="pin",
+                    imageURL=image_url,
+                )
+            )
 
         logger.debug("Fallback HTML parser found %d pins", len(results))
         return results
 
-    def _extract_primary_image_url(self, pin_obj: Dict[str, Any]) -> Optional[str]:
-        images = pin_obj.get("images")
-        if not isinstance(images, dict):
-            return None
-
-        # Prioritise 'orig', then other sizes
-        if "orig" in images and isinstance(images["orig"], dict):
-            return images["orig"].get("url")
-
-        for size_data in images.values():
-            if isinstance(size_data, dict) and "url" in size_data:
-                return size_data["url"]
-
-        return None
-
-    def _normalize_pin(self, pin_obj: Dict[str, Any]) -> Dict[str, Any]:
-        pin_id = str(pin_obj.get("id"))
-        title = (
-            pin_obj.get("grid_title")
-            or pin_obj.get("title")
-            or pin_obj.get("description")
-            or ""
-        )
-
-        pinner = pin_obj.get("pinner") or pin_obj.get("owner") or {}
-        if not isinstance(pinner, dict):
-            pinner = {}
-
-        pinner_id = pinner.get("id") or pinner.get("user_id")
-        username = pinner.get("username") or pinner.get("urlname")
-        full_name = pinner.get("full_name") or pinner.get("fullName")
-        avatar_url = None
-        if "image_small_url" in pinner:
-            avatar_url = pinner.get("image_small_url")
-        elif "image_medium_url" in pinner:
-            avatar_url = pinner.get("image_medium_url")
-        elif "image_xlarge_url" in pinner:
-            avatar_url = pinner.get("image_xlarge_url")
-
-        followers = pinner.get("follower_count") or pinner.get(
-            "followers"
-        )
-
-        created_at = (
-            pin_obj.get("created_at")
-            or pin_obj.get("created_at_timestamp")
-            or pin_obj.get("createdAt")
-        )
-        date_info = parse_pinterest_timestamp(created_at)
-
-        image_url = self._extract_primary_image_url(pin_obj) or ""
-
-        normalized = {
-            "id": pin_id,
-            "title": title,
-            "pinner": {
-                "id": pinner_id,
-                "username": username,
-                "fullName": full_name,
-                "avatarURL": avatar_url,
-                "followers": followers,
-            },
-            "date": date_info,
-            "type": pin_obj.get("type") or "pin",
-            "imageURL": image_url,
-        }
-        return normalized
-
     def search(
         self,
         query: str,
         limit: int = 50,
         content_filter: str = "all",
-    ) -> List[Dict[str, Any]]:
+    ) -> List[NormalizedPin]:
+        """
+        Run a Pinterest search and return a list of normalized pins.
+        """
+        url, params = self._build_search_url(query, content_filter)
+        logger.info("Fetching Pinterest search results for query %r", query)
+        resp = self._request(url, params)
+        pins = self._parse_search_response(resp, query, limit)
+        self._store_response(url, params, resp, pins)
+        return pins
+
+    async def search_async(
+        self,
+        query: str,
+        limit: int = 50,
+        content_filter: str = "all",
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> List[NormalizedPin]:
         """
-        Run a Pinterest search and return a list of normalized pin dictionaries.
+        Async variant of ``search`` backed by httpx. Pass a client from
+        ``async_client()`` to reuse its connection across searches;
+        otherwise a short-lived one is created for this call.
         """
+        if client is None:
+            async with self.async_client() as own_client:
+                return await self.search_async(
+                    query, limit, content_filter, client=own_client
+                )
+
         url, params = self._build_search_url(query, content_filter)
         logger.info("Fetching Pinterest search results for query %r", query)
-        resp = self._request_with_retries(url, params)
+        resp = await self._request_async(client, url, params)
+        pins = await self._parse_search_response_async(resp, query, limit)
+        self._store_response(url, params, resp, pins)
+        return pins
+
+    async def _parse_search_response_async(
+        self,
+        resp: Union[httpx.Response, CachedResponse, None],
+        query: str,
+        limit: int,
+    ) -> List[NormalizedPin]:
+        content = self._response_content(resp, query)
+        if content is None:
+            return []
+
+        if self._use_process_pool(limit):
+            # Normalize off the event loop so concurrent jobs keep running.
+            pins_raw = self._find_pin_objects(content, limit=limit * 2)
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            chunks = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor,
+                        _normalize_pins,
+                        pins_raw[i : i + _NORMALIZE_CHUNK_SIZE],
+                    )
+                    for i in range(0, len(pins_raw), _NORMALIZE_CHUNK_SIZE)
+                )
+            )
+            normalized = [pin for chunk in chunks for pin in chunk][:limit]
+        else:
+            normalized = self._find_pin_objects(
+                content, limit=limit, normalize=_try_normalize_pin
+            )
+        return self._finish_search(content, normalized, query, limit)
+
+    def _parse_search_response(
+        self,
+        resp: Union[requests.Response, httpx.Response, CachedResponse, None],
+        query: str,
+        limit: int,
+    ) -> List[NormalizedPin]:
+        content = self._response_content(resp, query)
+        if content is None:
+            return []
 
+        if self._use_process_pool(limit):
+            pins_raw = self._find_pin_objects(content, limit=limit * 2)
+            results = self._get_executor().map(
+                _try_normalize_pin, pins_raw, chunksize=_NORMALIZE_CHUNK_SIZE
+            )
+            normalized = [pin for pin in results if pin is not None][:limit]
+        else:
+            normalized = self._find_pin_objects(
+                content, limit=limit, normalize=_try_normalize_pin
+            )
+        return self._finish_search(content, normalized, query, limit)
+
+    def _response_content(
+        self,
+        resp: Union[requests.Response, httpx.Response, CachedResponse, None],
+        query: str,
+    ) -> Optional[bytes]:
         if resp is None:
             logger.error("No response received from Pinterest.")
-            return []
+            return None
 
         if resp.status_code != 200:
             logger.error(
@@ -298,31 +667,54 @@ class PinterestSearchScraper:
                 resp.status_code,
                 query,
             )
-            return []
+            return None
+
+        return resp.content
+
+    def _use_process_pool(self, limit: int) -> bool:
+        # Oversampled raw pins (limit * 2) are normalized in worker
+        # processes so normalization failures don't leave us short.
+        return (
+            self.config.normalize_workers > 1
+            and limit > _PARALLEL_NORMALIZE_MIN_PINS
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Lazily start the normalization pool, shared by every search on this
+        scraper. Workers are spawned rather than forked so they never
+        inherit a running event loop.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.config.normalize_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
 
-        html = resp.text
-        blobs = self._extract_json_blobs_from_html(html)
-        pins_raw: List[Dict[str, Any]] = []
-        if blobs:
-            pins_raw = self._find_pin_objects(blobs)
+    def close(self) -> None:
+        """
+        Release the HTTP session and shut down the normalization pool.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.session.close()
 
-        if not pins_raw:
+    def _finish_search(
+        self,
+        content: bytes,
+        normalized: List[NormalizedPin],
+        query: str,
+        limit: int,
+    ) -> List[NormalizedPin]:
+        if not normalized:
             logger.warning(
                 "Structured pin data not found for query %r, "
                 "falling back to HTML parsing.",
                 query,
             )
-            return self._fallback_parse_from_html(html)[:limit]
-
-        normalized: List[Dict[str, Any]] = []
-        for pin_obj in pins_raw:
-            try:
-                normalized_pin = self._normalize_pin(pin_obj)
-                normalized.append(normalized_pin)
-                if len(normalized) >= limit:
-                    break
-            except Exception as exc:
-                logger.debug("Failed to normalize pin object: %s", exc)
+            return self._fallback_parse_from_html(content)[:limit]
 
         logger.info(
             "Parsed %d pins (limit %d) for query %r",
@@ -330,4 +722,4 @@ class PinterestSearchScraper:
             limit,
             query,
         )
-        return normalized
\ No newline at end of file
+        return normalized
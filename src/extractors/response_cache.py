@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+logger = logging.getLogger("response_cache")
+
+@dataclass
+class CachedResponse:
+    """
+    Minimal stand-in for a successful HTTP response served from the cache.
+    """
+
+    content: bytes
+    status_code: int = 200
+
+class ResponseCache:
+    """
+    Cache of search page bodies keyed on the request URL and params.
+
+    Entries live in a small in-process LRU and, when ``directory`` is set,
+    as one file per key on disk so that re-runs skip the network too.
+    Anything older than ``ttl_seconds`` is treated as missing. Expired
+    files are swept from the directory when the cache is created and
+    deleted whenever a lookup finds one.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 128,
+    ) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            self._sweep_expired()
+
+    def _key(self, url: str, params: Dict[str, Any]) -> str:
+        canonical = f"{url}?{urlencode(sorted(params.items()))}"
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+    def _is_fresh(self, stored_at: float) -> bool:
+        return time.time() - stored_at < self.ttl_seconds
+
+    def get(self, url: str, params: Dict[str, Any]) -> Optional[bytes]:
+        key = self._key(url, params)
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            stored_at, content = entry
+            if self._is_fresh(stored_at):
+                self._memory.move_to_end(key)
+                return content
+            del self._memory[key]
+
+        if not self.directory:
+            return None
+
+        path = os.path.join(self.directory, key)
+        try:
+            stored_at = os.path.getmtime(path)
+            if not self._is_fresh(stored_at):
+                self._remove_file(path)
+                return None
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+
+        self._remember(key, stored_at, content)
+        return content
+
+    def put(self, url: str, params: Dict[str, Any], content: bytes) -> None:
+        key = self._key(url, params)
+        self._remember(key, time.time(), content)
+
+        if not self.directory:
+            return
+
+        path = os.path.join(self.directory, key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Failed to write response cache entry %s: %s", path, exc)
+
+    def _sweep_expired(self) -> None:
+        try:
+            names = os.listdir(self.directory)
+        except OSError as exc:
+            logger.debug("Failed to list cache directory %s: %s", self.directory, exc)
+            return
+
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                if not os.path.isfile(path) or self._is_fresh(os.path.getmtime(path)):
+                    continue
+            except OSError:
+                continue
+            self._remove_file(path)
+
+    def _remove_file(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError as exc:
+            logger.debug("Failed to remove stale cache entry %s: %s", path, exc)
+
+    def _remember(self, key: str, stored_at: float, content: bytes) -> None:
+        self._memory[key] = (stored_at, content)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
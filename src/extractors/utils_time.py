@@ -2,12 +2,33 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional, Union
 
 from dateutil import parser as date_parser
 
 logger = logging.getLogger("utils_time")
 
+def _fast_parse(text: str) -> Optional[datetime]:
+    """
+    Parse the timestamp shapes Pinterest actually emits without dateutil.
+
+    ISO-8601 goes through the C-implemented datetime.fromisoformat (a
+    trailing 'Z' is rewritten for Pythons older than 3.11) and RFC 2822
+    ("Mon, 19 Aug 2024 04:13:09 +0000") through the email module. Returns
+    None for anything else so the caller can fall back to dateutil.
+    """
+    iso_text = text[:-1] + "+00:00" if text[-1:] in ("Z", "z") else text
+    try:
+        return datetime.fromisoformat(iso_text)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+
 def _safe_to_datetime(
     value: Union[str, int, float, None]
 ) -> Optional[datetime]:
@@ -26,7 +47,9 @@ def _safe_to_datetime(
         if not text:
             return None
         try:
-            dt = date_parser.parse(text)
+            dt = _fast_parse(text)
+            if dt is None:
+                dt = date_parser.parse(text)
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=timezone.utc)
             return dt.astimezone(timezone.utc)
@@ -37,6 +60,13 @@ def _safe_to_datetime(
     logger.debug("Unsupported timestamp type: %r", type(value))
     return None
 
+@lru_cache(maxsize=4096)
+def _format_timestamp(raw: Union[str, int, float, None]) -> Optional[str]:
+    dt = _safe_to_datetime(raw)
+    if dt is None:
+        return None
+    return dt.strftime("%Y-%m-%d")
+
 def parse_pinterest_timestamp(
     raw: Union[str, int, float, None]
 ) -> Dict[str, Any]:
@@ -47,10 +77,14 @@ def parse_pinterest_timestamp(
         "formatted": "YYYY-MM-DD" or None,
         "initial": "<original string or None>"
     }
-    """
-    dt = _safe_to_datetime(raw)
-    if dt is None:
-        return {"formatted": None, "initial": raw}
 
-    formatted = dt.strftime("%Y-%m-%d")
-    return {"formatted": formatted, "initial": raw}
\ No newline at end of file
+    Pins in one result set often share a timestamp, so the parse and
+    format step is memoized per raw value. A fresh dict is returned on
+    every call so callers never share mutable state through the cache.
+    """
+    try:
+        formatted = _format_timestamp(raw)
+    except TypeError:
+        # Unhashable input; it cannot be parsed anyway.
+        formatted = None
+    return {"formatted": formatted, "initial": raw}
@@ -2,12 +2,54 @@ import csv
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Optional
+import re
+from datetime import date, time
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-import pandas as pd
+from openpyxl import Workbook
+
+from ..extractors.models import NormalizedPin
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
 
 logger = logging.getLogger("exporters")
 
+Row = Union[NormalizedPin, Dict[str, Any]]
+
+def _to_jsonable(obj: Any) -> Any:
+    if isinstance(obj, NormalizedPin):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# Cell types openpyxl writes natively; anything else is stringified the
+# way the previous pandas-based export did.
+_EXCEL_NATIVE_TYPES = (str, int, float, bool, date, time)
+
+# Characters outside the XML 1.0 Char production (mostly C0 control
+# characters); lxml refuses them and ElementTree would write invalid XML.
+_XML_ILLEGAL_RE = re.compile(
+    "[^\u0009\u000A\u000D\u0020-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]"
+)
+
+def _xml_text(value: Any) -> str:
+    if value is None:
+        return ""
+    return _XML_ILLEGAL_RE.sub("", str(value))
+
+def _excel_cell(value: Any) -> Any:
+    if value is None or isinstance(value, _EXCEL_NATIVE_TYPES):
+        return value
+    return str(value)
+
 class DataExporter:
     """
     Export scraped data into various formats: JSON, JSONL, CSV, XLSX, XML.
@@ -26,7 +68,7 @@ class DataExporter:
 
     def export(
         self,
-        data: Iterable[Dict[str, Any]],
+        data: Iterable[Row],
         filename_stub: str,
         output_format: Optional[str] = None,
     ) -> str:
@@ -54,71 +96,157 @@ class DataExporter:
 
         return path
 
-    def _export_json(self, data: List[Dict[str, Any]], path: str) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _export_json(self, data: List[Row], path: str) -> None:
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(
+                    data, f, ensure_ascii=False, indent=2, default=_to_jsonable
+                )
         logger.info("JSON export written to %s", path)
 
-    def _export_jsonl(self, data: List[Dict[str, Any]], path: str) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            for item in data:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    def _export_jsonl(self, data: List[Row], path: str) -> None:
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.writelines(
+                    orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+                    for item in data
+                )
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                for item in data:
+                    f.write(
+                        json.dumps(item, ensure_ascii=False, default=_to_jsonable)
+                        + "\n"
+                    )
         logger.info("JSONL export written to %s", path)
 
-    def _export_csv(self, data: List[Dict[str, Any]], path: str) -> None:
+    def _export_csv(self, data: List[Row], path: str) -> None:
         if not data:
             # Write an empty file with no headers
             open(path, "w", encoding="utf-8").close()
             logger.warning("CSV export created empty file at %s", path)
             return
 
-        # Collect fieldnames from union of keys across all rows (flattening nested dicts)
-        flat_rows = [self._flatten_dict(row) for row in data]
-        fieldnames: List[str] = []
-        for row in flat_rows:
-            for key in row.keys():
-                if key not in fieldnames:
-                    fieldnames.append(key)
+        flat_rows = [self._flatten_row(row) for row in data]
+        fieldnames = self._collect_fieldnames(flat_rows)
 
         with open(path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(flat_rows)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                [row.get(key, "") for key in fieldnames] for row in flat_rows
+            )
 
         logger.info("CSV export written to %s", path)
 
-    def _export_excel(self, data: List[Dict[str, Any]], path: str) -> None:
-        df = pd.DataFrame([self._flatten_dict(row) for row in data])
-        df.to_excel(path, index=False)
+    def _export_excel(self, data: List[Row], path: str) -> None:
+        flat_rows = [self._flatten_row(row) for row in data]
+        fieldnames = self._collect_fieldnames(flat_rows)
+
+        # Write-only mode streams rows to the file instead of keeping a
+        # full cell grid in memory.
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sheet1")
+        if fieldnames:
+            ws.append(fieldnames)
+        for row in flat_rows:
+            ws.append([_excel_cell(row.get(key)) for key in fieldnames])
+        wb.save(path)
         logger.info("Excel export written to %s", path)
 
-    def _export_xml(self, data: List[Dict[str, Any]], path: str) -> None:
+    def _export_xml(self, data: List[Row], path: str) -> None:
+        if etree is None:
+            self._export_xml_stdlib(data, path)
+            return
+
+        # Stream one <pin> at a time instead of holding the whole tree.
+        with etree.xmlfile(path, encoding="utf-8") as xf:
+            xf.write_declaration()
+            with xf.element("pins"):
+                for row in data:
+                    flat = self._flatten_row(row)
+                    with xf.element("pin"):
+                        for key, value in flat.items():
+                            child = etree.Element(key)
+                            child.text = _xml_text(value)
+                            xf.write(child)
+        logger.info("XML export written to %s", path)
+
+    def _export_xml_stdlib(self, data: List[Row], path: str) -> None:
         from xml.etree.ElementTree import Element, SubElement, ElementTree
 
         root = Element("pins")
 
         for row in data:
             pin_el = SubElement(root, "pin")
-            flat = self._flatten_dict(row)
+            flat = self._flatten_row(row)
             for key, value in flat.items():
                 child = SubElement(pin_el, key)
-                child.text = "" if value is None else str(value)
+                child.text = _xml_text(value)
 
         tree = ElementTree(root)
         tree.write(path, encoding="utf-8", xml_declaration=True)
         logger.info("XML export written to %s", path)
 
+    def _collect_fieldnames(self, flat_rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Union of keys across all rows, in order of first appearance.
+        """
+        return list(dict.fromkeys(chain.from_iterable(flat_rows)))
+
+    def _flatten_row(self, row: Row) -> Dict[str, Any]:
+        if isinstance(row, NormalizedPin):
+            return self._flatten_pin(row)
+        return self._flatten_dict(row)
+
+    def _flatten_pin(self, pin: NormalizedPin) -> Dict[str, Any]:
+        """
+        Flatten a normalized pin by reading its fixed schema directly.
+        Produces the same keys, in the same order, as ``_flatten_dict``
+        applied to ``pin.to_dict()``.
+        """
+        pinner = pin.pinner
+        date_info = pin.date
+        return {
+            "id": pin.id,
+            "title": pin.title,
+            "pinner.id": pinner.id,
+            "pinner.username": pinner.username,
+            "pinner.fullName": pinner.fullName,
+            "pinner.avatarURL": pinner.avatarURL,
+            "pinner.followers": pinner.followers,
+            "date.formatted": date_info.get("formatted"),
+            "date.initial": date_info.get("initial"),
+            "type": pin.type,
+            "imageURL": pin.imageURL,
+        }
+
     def _flatten_dict(
         self, data: Dict[str, Any], parent_key: str = "", sep: str = "."
     ) -> Dict[str, Any]:
         """
         Flatten nested dictionaries using dot-separated keys.
+
+        Walks with an explicit stack of item iterators rather than recursing,
+        which keeps keys in the same depth-first order.
         """
         items: Dict[str, Any] = {}
-        for key, value in data.items():
-            new_key = f"{parent_key}{sep}{key}" if parent_key else key
-            if isinstance(value, dict):
-                items.update(self._flatten_dict(value, new_key, sep=sep))
-            else:
+        stack = [(parent_key, iter(data.items()))]
+        while stack:
+            prefix, entries = stack[-1]
+            for key, value in entries:
+                new_key = f"{prefix}{sep}{key}" if prefix else key
+                if isinstance(value, dict):
+                    stack.append((new_key, iter(value.items())))
+                    break
                 items[new_key] = value
-        return items
\ No newline at end of file
+            else:
+                stack.pop()
+        return items
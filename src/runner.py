@@ -1,11 +1,16 @@
 import argparse
+import asyncio
 import json
 import logging
 import os
 import sys
 from typing import Any, Dict, List, Optional
 
+import httpx
+
+from .extractors.models import NormalizedPin
 from .extractors.pinterest_parser import PinterestSearchScraper
+from .extractors.response_cache import ResponseCache
 from .outputs.exporters import DataExporter
 
 def configure_logging(verbosity: int) -> None:
@@ -71,7 +76,9 @@ def build_jobs(
         job.setdefault("filter", default_filter)
     return jobs
 
-def create_scraper(config: Dict[str, Any]) -> PinterestSearchScraper:
+def create_scraper(
+    config: Dict[str, Any], root_dir: Optional[str] = None
+) -> PinterestSearchScraper:
     http_cfg = config.get("http", {}) or {}
     base_url = config.get("base_url", "https://www.pinterest.com/search/pins/")
     timeout = float(http_cfg.get("timeout", 10))
@@ -84,14 +91,89 @@ def create_scraper(config: Dict[str, Any]) -> PinterestSearchScraper:
         )
     )
 
+    normalize_workers = int(config.get("normalize_workers", 0))
+
+    cache_cfg = config.get("cache", {}) or {}
+    response_cache = None
+    if cache_cfg.get("enabled", False):
+        cache_dir = str(cache_cfg.get("directory", os.path.join("data", ".cache")))
+        if root_dir is not None and not os.path.isabs(cache_dir):
+            cache_dir = os.path.join(root_dir, cache_dir)
+        response_cache = ResponseCache(
+            directory=cache_dir,
+            ttl_seconds=float(cache_cfg.get("ttl_seconds", 3600)),
+            max_entries=int(cache_cfg.get("max_entries", 128)),
+        )
+
     return PinterestSearchScraper(
         base_url=base_url,
         timeout=timeout,
         max_retries=max_retries,
         backoff_factor=backoff_factor,
         user_agent=user_agent,
+        normalize_workers=normalize_workers,
+        response_cache=response_cache,
     )
 
+async def run_jobs(
+    scraper: PinterestSearchScraper,
+    jobs: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    concurrency: int = 4,
+) -> List[List[NormalizedPin]]:
+    """
+    Run all jobs concurrently over one shared HTTP/2 client, with at most
+    ``concurrency`` requests in flight. Results keep the order of ``jobs``;
+    a failed job contributes an empty list.
+    """
+    logger = logging.getLogger("runner")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_job(
+        idx: int, job: Dict[str, Any], client: httpx.AsyncClient
+    ) -> List[NormalizedPin]:
+        query = job["query"]
+        limit = int(job.get("limit", config.get("default_limit", 50)))
+        content_filter = str(job.get("filter", config.get("content_filter", "all")))
+
+        async with semaphore:
+            logger.info(
+                "Running job %d/%d: query=%r, limit=%d, filter=%s",
+                idx,
+                len(jobs),
+                query,
+                limit,
+                content_filter,
+            )
+
+            try:
+                results = await scraper.search_async(
+                    query=query,
+                    limit=limit,
+                    content_filter=content_filter,
+                    client=client,
+                )
+                logger.info(
+                    "Job %d completed: retrieved %d pins for query %r",
+                    idx,
+                    len(results),
+                    query,
+                )
+                return results
+            except Exception as exc:
+                logger.exception(
+                    "Job %d failed for query %r: %s", idx, query, exc
+                )
+                return []
+
+    async with scraper.async_client() as client:
+        return await asyncio.gather(
+            *(
+                run_job(idx, job, client)
+                for idx, job in enumerate(jobs, start=1)
+            )
+        )
+
 def ensure_directory(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
@@ -178,45 +260,23 @@ def main(argv: Optional[List[str]] = None) -> int:
         logger.error("No valid jobs to run. Exiting.")
         return 1
 
-    scraper = create_scraper(config)
+    scraper = create_scraper(config, root_dir=default_root)
     output_cfg = config.get("output", {}) or {}
     output_dir = args.output_dir or output_cfg.get("directory") or default_output_dir
     output_format = (args.output_format or output_cfg.get("format") or "json").lower()
     ensure_directory(output_dir)
     exporter = DataExporter(output_dir=output_dir, default_format=output_format)
 
-    all_results: List[Dict[str, Any]] = []
-    for idx, job in enumerate(jobs, start=1):
-        query = job["query"]
-        limit = int(job.get("limit", config.get("default_limit", 50)))
-        content_filter = str(job.get("filter", config.get("content_filter", "all")))
-
-        logger.info(
-            "Running job %d/%d: query=%r, limit=%d, filter=%s",
-            idx,
-            len(jobs),
-            query,
-            limit,
-            content_filter,
-        )
+    http_cfg = config.get("http", {}) or {}
+    concurrency = max(1, int(http_cfg.get("concurrency", 4)))
+    try:
+        job_results = asyncio.run(run_jobs(scraper, jobs, config, concurrency))
+    finally:
+        scraper.close()
 
-        try:
-            results = scraper.search(
-                query=query,
-                limit=limit,
-                content_filter=content_filter,
-            )
-            logger.info(
-                "Job %d completed: retrieved %d pins for query %r",
-                idx,
-                len(results),
-                query,
-            )
-            all_results.extend(results)
-        except Exception as exc:
-            logger.exception(
-                "Job %d failed for query %r: %s", idx, query, exc
-            )
+    all_results: List[NormalizedPin] = []
+    for results in job_results:
+        all_results.extend(results)
 
     if not all_results:
         logger.warning("No results collected from any job.")
@@ -0,0 +1,42 @@
+import unittest
+
+from src.extractors.pinterest_parser import PinterestSearchScraper, _try_normalize_pin
+
+def _page(script: bytes) -> bytes:
+    return b"<html><body><script>" + script + b"</script></body></html>"
+
+class FindPinObjectsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scraper = PinterestSearchScraper()
+
+    def tearDown(self) -> None:
+        self.scraper.close()
+
+    def _find(self, html: bytes):
+        return self.scraper._find_pin_objects(
+            html, limit=50, normalize=_try_normalize_pin
+        )
+
+    def test_truncated_blob_yields_no_pins(self) -> None:
+        html = _page(
+            b'{"initialReduxState": {"pins": [{"id":"1","title":"t"}, {"id": '
+        )
+        self.assertEqual(self._find(html), [])
+
+    def test_marker_script_with_trailing_js_yields_no_pins(self) -> None:
+        html = _page(
+            b'window.__PWS_DATA__ = {"initialReduxState": '
+            b'{"pins": [{"id":"1","title":"t"}]}}; foo({});'
+        )
+        self.assertEqual(self._find(html), [])
+
+    def test_valid_marker_blob_yields_each_pin_once(self) -> None:
+        html = _page(
+            b'window.__PWS_DATA__ = {"initialReduxState": '
+            b'{"pins": [{"id":"1","title":"t"}]}};'
+        )
+        pins = self._find(html)
+        self.assertEqual([pin.id for pin in pins], ["1"])
+
+if __name__ == "__main__":
+    unittest.main()